@@ -70,7 +70,8 @@ const config = {
   healthCheck: {
     interval: parseInt(process.env.HEALTH_CHECK_INTERVAL || '30000', 10),
     timeout: parseInt(process.env.HEALTH_CHECK_TIMEOUT || '5000', 10),
-    retries: parseInt(process.env.HEALTH_CHECK_RETRIES || '3', 10)
+    retries: parseInt(process.env.HEALTH_CHECK_RETRIES || '3', 10),
+    concurrency: parseInt(process.env.HEALTH_CHECK_CONCURRENCY || '16', 10)
   },
 
   // Security
@@ -396,8 +396,11 @@ export class ChittyRegistryNeonMCPAgent extends McpAgent {
   private async getIntelligentRecommendations(args: any) {
     const { task, context = {}, learningEnabled = true } = args;
 
-    // Analyze task using NLP-like keyword matching
-    const taskKeywords = task.toLowerCase().split(' ');
+    // Analyze task using NLP-like keyword matching; patterns are compiled once
+    // per query and matched case-insensitively, so service text is not lowercased
+    const taskPatterns = task.split(' ').map(keyword =>
+      new RegExp(keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'), 'i')
+    );
     const serviceScores = new Map();
 
     // Get all services from Neon
@@ -408,10 +411,10 @@ export class ChittyRegistryNeonMCPAgent extends McpAgent {
       let score = 0;
 
       // Check description and capabilities
-      const serviceText = `${service.description} ${JSON.stringify(service.capabilities)}`.toLowerCase();
+      const serviceText = `${service.description} ${JSON.stringify(service.capabilities)}`;
 
-      for (const keyword of taskKeywords) {
-        if (serviceText.includes(keyword)) {
+      for (const pattern of taskPatterns) {
+        if (pattern.test(serviceText)) {
           score += 10;
         }
       }
@@ -5,6 +5,22 @@ import { McpAgent } from '@cloudflare/mcp-agent-api';
 import { RegistryService } from './services/RegistryService';
 import { HealthMonitor } from './services/HealthMonitor';
 
+// Task phrase to candidate service mapping, matched in a single pass below
+const TASK_MAPPINGS: Record<string, string[]> = {
+  'generate identity token': ['chittyid'],
+  'authenticate user': ['chittyauth', 'chittyid'],
+  'store evidence': ['chittyassets', 'chittychain'],
+  'verify document': ['chittyverify', 'chittytrust'],
+  'blockchain verification': ['chittychain', 'chittyoracle'],
+  'monitor services': ['chittybeacon', 'chittymonitor'],
+  'ai integration': ['chittymcp', 'chittyrouter'],
+  'legal analysis': ['chittyintel', 'chittyforce'],
+  'case management': ['chittychronicle', 'chittyflow'],
+  'payment processing': ['chittypay', 'chittyfinance']
+};
+
+const TASK_PATTERN = new RegExp(Object.keys(TASK_MAPPINGS).join('|'), 'gi');
+
 export class ChittyRegistryMCPAgent extends McpAgent {
   private registry: RegistryService;
   private healthMonitor: HealthMonitor;
@@ -267,26 +283,15 @@ export class ChittyRegistryMCPAgent extends McpAgent {
   }
 
   private async resolveServiceForTask(task: string, requirements: any = {}) {
-    // AI-powered task-to-service mapping
-    const taskMappings = {
-      'generate identity token': ['chittyid'],
-      'authenticate user': ['chittyauth', 'chittyid'],
-      'store evidence': ['chittyassets', 'chittychain'],
-      'verify document': ['chittyverify', 'chittytrust'],
-      'blockchain verification': ['chittychain', 'chittyoracle'],
-      'monitor services': ['chittybeacon', 'chittymonitor'],
-      'ai integration': ['chittymcp', 'chittyrouter'],
-      'legal analysis': ['chittyintel', 'chittyforce'],
-      'case management': ['chittychronicle', 'chittyflow'],
-      'payment processing': ['chittypay', 'chittyfinance']
-    };
-
-    const taskLower = task.toLowerCase();
+    // AI-powered task-to-service mapping: one case-insensitive scan of the task
+    const matchedKeys = new Set(
+      Array.from(task.matchAll(TASK_PATTERN), match => match[0].toLowerCase())
+    );
     let candidateServices: string[] = [];
 
     // Find matching services
-    for (const [taskKey, services] of Object.entries(taskMappings)) {
-      if (taskLower.includes(taskKey)) {
+    for (const [taskKey, services] of Object.entries(TASK_MAPPINGS)) {
+      if (matchedKeys.has(taskKey)) {
         candidateServices.push(...services);
       }
     }
@@ -1,6 +1,8 @@
 // Authority Service Integration - Connects to schema.chitty.cc, canon.chitty.cc, etc.
 
 import axios, { AxiosInstance } from 'axios';
+import http from 'http';
+import https from 'https';
 import { Service, HealthStatus, AuthorityServices } from '../types';
 import { logger } from '../utils/logger';
 
@@ -10,29 +12,41 @@ export class AuthorityService {
   private idClient: AxiosInstance;
   private trustClient: AxiosInstance;
 
+  // Shared keep-alive agents so repeated authority calls reuse TCP/TLS connections
+  private httpAgent = new http.Agent({ keepAlive: true, maxSockets: 64 });
+  private httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 64 });
+
   constructor(private authorities: AuthorityServices) {
     this.schemaClient = axios.create({
       baseURL: authorities.chittySchema.url,
       timeout: 5000,
-      headers: { 'User-Agent': 'ChittyRegistry/1.0' }
+      headers: { 'User-Agent': 'ChittyRegistry/1.0' },
+      httpAgent: this.httpAgent,
+      httpsAgent: this.httpsAgent
     });
 
     this.canonClient = axios.create({
       baseURL: authorities.chittyCanon.url,
       timeout: 5000,
-      headers: { 'User-Agent': 'ChittyRegistry/1.0' }
+      headers: { 'User-Agent': 'ChittyRegistry/1.0' },
+      httpAgent: this.httpAgent,
+      httpsAgent: this.httpsAgent
     });
 
     this.idClient = axios.create({
       baseURL: authorities.chittyId.url,
       timeout: 5000,
-      headers: { 'User-Agent': 'ChittyRegistry/1.0' }
+      headers: { 'User-Agent': 'ChittyRegistry/1.0' },
+      httpAgent: this.httpAgent,
+      httpsAgent: this.httpsAgent
     });
 
     this.trustClient = axios.create({
       baseURL: authorities.chittyTrust.url,
       timeout: 5000,
-      headers: { 'User-Agent': 'ChittyRegistry/1.0' }
+      headers: { 'User-Agent': 'ChittyRegistry/1.0' },
+      httpAgent: this.httpAgent,
+      httpsAgent: this.httpsAgent
     });
   }
 
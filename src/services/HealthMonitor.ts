@@ -1,6 +1,8 @@
 // Health Monitoring Service for all ChittyOS services
 
-import axios, { AxiosResponse } from 'axios';
+import axios, { AxiosInstance, AxiosResponse } from 'axios';
+import http from 'http';
+import https from 'https';
 import * as cron from 'node-cron';
 import { Service, HealthStatus, CHITTYOS_SERVICES } from '../types';
 import { RegistryService } from './RegistryService';
@@ -10,12 +12,22 @@ export class HealthMonitor {
   private isRunning = false;
   private cronJob?: cron.ScheduledTask;
 
+  // Keep-alive client so each check cycle reuses connections to service hosts
+  private httpClient: AxiosInstance = axios.create({
+    httpAgent: new http.Agent({ keepAlive: true, maxSockets: 64 }),
+    httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 64 }),
+    headers: {
+      'User-Agent': 'ChittyRegistry-HealthMonitor/1.0'
+    }
+  });
+
   constructor(
     private registry: RegistryService,
     private config: {
       interval: number;
       timeout: number;
       retries: number;
+      concurrency?: number;
     }
   ) {}
 
@@ -72,25 +84,20 @@ export class HealthMonitor {
       // Get all registered services
       const services = await this.registry.discoverServices({ includeUnhealthy: true });
 
-      // Check all services in parallel with limited concurrency
-      const healthPromises = services.map(service =>
-        this.checkServiceHealth(service).catch(error => {
+      // Check all services in parallel with limited concurrency, storing each
+      // result as soon as its check completes
+      const healthResults = await this.mapWithConcurrency(services, async service => {
+        const health = await this.checkServiceHealth(service).catch(error => {
           logger.error('Health check failed', {
             serviceName: service.serviceName,
             error: error.message
           });
           return this.createUnhealthyStatus(service, error.message);
-        })
-      );
-
-      const healthResults = await Promise.all(healthPromises);
+        });
 
-      // Update health statuses
-      await Promise.all(
-        healthResults.map(health =>
-          this.registry.updateHealthStatus(health.serviceId, health)
-        )
-      );
+        await this.registry.updateHealthStatus(health.serviceId, health);
+        return health;
+      });
 
       const healthyCount = healthResults.filter(h => h.status === 'HEALTHY').length;
       const totalCount = healthResults.length;
@@ -124,14 +131,11 @@ export class HealthMonitor {
       // Retry logic
       while (attempt < this.config.retries) {
         try {
-          response = await axios({
+          response = await this.httpClient.request({
             method,
             url: healthUrl,
             timeout,
-            validateStatus: (status) => status === expectedStatus,
-            headers: {
-              'User-Agent': 'ChittyRegistry-HealthMonitor/1.0'
-            }
+            validateStatus: (status) => status === expectedStatus
           });
           break;
         } catch (error) {
@@ -236,6 +240,25 @@ export class HealthMonitor {
     }
   }
 
+  /**
+   * Run a task for each item with at most `config.concurrency` in flight
+   */
+  private async mapWithConcurrency<T, R>(items: T[], task: (item: T) => Promise<R>): Promise<R[]> {
+    const results: R[] = new Array(items.length);
+    const workerCount = Math.min(Math.max(1, this.config.concurrency || 16), items.length);
+    let next = 0;
+
+    const workers = Array.from({ length: workerCount }, async () => {
+      while (next < items.length) {
+        const index = next++;
+        results[index] = await task(items[index]);
+      }
+    });
+
+    await Promise.all(workers);
+    return results;
+  }
+
   /**
    * Delay utility for retry logic
    */
@@ -275,6 +298,7 @@ export class HealthMonitor {
     interval: number;
     timeout: number;
     retries: number;
+    concurrency: number;
     nextCheck?: Date;
   } {
     return {
@@ -282,6 +306,7 @@ export class HealthMonitor {
       interval: this.config.interval,
       timeout: this.config.timeout,
       retries: this.config.retries,
+      concurrency: this.config.concurrency || 16,
       nextCheck: undefined
     };
   }
@@ -1,25 +1,30 @@
 // Neon Database Service for ChittyRegistry
 // Provides persistent storage for registry data, health history, and MCP agent state
 
-import { Client } from 'pg';
+import { Pool } from 'pg';
 import { logger } from '../utils/logger';
 
 export class NeonService {
-  private client: Client;
+  private pool: Pool;
   private connected = false;
 
-  constructor(private connectionString: string) {
-    this.client = new Client({
+  constructor(private connectionString: string, poolSize: number = 10) {
+    this.pool = new Pool({
       connectionString: this.connectionString,
+      max: poolSize,
       ssl: {
         rejectUnauthorized: false
       }
     });
+
+    this.pool.on('error', (err) => {
+      logger.error('Neon pool client error', { error: err.message });
+    });
   }
 
   async connect(): Promise<void> {
     try {
-      await this.client.connect();
+      await this.pool.query('SELECT 1');
       this.connected = true;
       logger.info('Connected to Neon database');
 
@@ -33,7 +38,7 @@ export class NeonService {
 
   async disconnect(): Promise<void> {
     try {
-      await this.client.end();
+      await this.pool.end();
       this.connected = false;
       logger.info('Disconnected from Neon database');
     } catch (error) {
@@ -46,9 +51,14 @@ export class NeonService {
   }
 
   private async initializeSchema(): Promise<void> {
+    // Run all DDL on one checked-out client inside a single transaction
+    const client = await this.pool.connect();
+
     try {
+      await client.query('BEGIN');
+
       // Services table for persistent registry data
-      await this.client.query(`
+      await client.query(`
         CREATE TABLE IF NOT EXISTS services (
           id SERIAL PRIMARY KEY,
           chitty_id VARCHAR(255) UNIQUE NOT NULL,
@@ -73,7 +83,7 @@ export class NeonService {
       `);
 
       // Health history table for monitoring trends
-      await this.client.query(`
+      await client.query(`
         CREATE TABLE IF NOT EXISTS health_history (
           id SERIAL PRIMARY KEY,
           service_name VARCHAR(255) NOT NULL,
@@ -87,7 +97,7 @@ export class NeonService {
       `);
 
       // MCP agent sessions for stateful interactions
-      await this.client.query(`
+      await client.query(`
         CREATE TABLE IF NOT EXISTS mcp_sessions (
           id SERIAL PRIMARY KEY,
           session_id VARCHAR(255) UNIQUE NOT NULL,
@@ -102,7 +112,7 @@ export class NeonService {
       `);
 
       // Service usage analytics
-      await this.client.query(`
+      await client.query(`
         CREATE TABLE IF NOT EXISTS service_usage (
           id SERIAL PRIMARY KEY,
           service_name VARCHAR(255) NOT NULL,
@@ -118,7 +128,7 @@ export class NeonService {
       `);
 
       // Authority service status
-      await this.client.query(`
+      await client.query(`
         CREATE TABLE IF NOT EXISTS authority_status (
           id SERIAL PRIMARY KEY,
           authority_name VARCHAR(100) NOT NULL,
@@ -130,61 +140,71 @@ export class NeonService {
       `);
 
       // Create indexes for performance
-      await this.client.query(`
+      await client.query(`
         CREATE INDEX IF NOT EXISTS idx_services_name ON services(service_name);
         CREATE INDEX IF NOT EXISTS idx_services_category ON services(category);
         CREATE INDEX IF NOT EXISTS idx_services_active ON services(is_active);
         CREATE INDEX IF NOT EXISTS idx_health_service_time ON health_history(service_name, checked_at);
         CREATE INDEX IF NOT EXISTS idx_mcp_session ON mcp_sessions(session_id);
         CREATE INDEX IF NOT EXISTS idx_usage_service_time ON service_usage(service_name, created_at);
+        CREATE INDEX IF NOT EXISTS idx_usage_time ON service_usage(created_at);
+        CREATE INDEX IF NOT EXISTS idx_authority_name_time ON authority_status(authority_name, checked_at DESC);
       `);
 
+      await client.query('COMMIT');
       logger.info('Neon database schema initialized successfully');
     } catch (error) {
+      await client.query('ROLLBACK').catch(() => {});
       logger.error('Failed to initialize Neon database schema', { error: error.message });
       throw error;
+    } finally {
+      client.release();
     }
   }
 
   // Service Management
   async upsertService(service: any): Promise<void> {
     try {
-      await this.client.query(`
-        INSERT INTO services (
-          chitty_id, service_name, display_name, description, version,
-          base_url, category, capabilities, endpoints, health_check,
-          metadata, trust_score, trust_level, registered_by, is_canonical
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
-        ON CONFLICT (service_name) DO UPDATE SET
-          display_name = EXCLUDED.display_name,
-          description = EXCLUDED.description,
-          version = EXCLUDED.version,
-          base_url = EXCLUDED.base_url,
-          category = EXCLUDED.category,
-          capabilities = EXCLUDED.capabilities,
-          endpoints = EXCLUDED.endpoints,
-          health_check = EXCLUDED.health_check,
-          metadata = EXCLUDED.metadata,
-          trust_score = EXCLUDED.trust_score,
-          trust_level = EXCLUDED.trust_level,
-          last_updated = CURRENT_TIMESTAMP
-      `, [
-        service.chittyId,
-        service.serviceName,
-        service.displayName,
-        service.description,
-        service.version,
-        service.baseUrl,
-        service.category,
-        JSON.stringify(service.capabilities || []),
-        JSON.stringify(service.endpoints || []),
-        JSON.stringify(service.healthCheck || {}),
-        JSON.stringify(service.metadata || {}),
-        service.trustScore || 0,
-        service.trustLevel || 'UNVERIFIED',
-        service.registeredBy,
-        service.metadata?.canonical || false
-      ]);
+      await this.pool.query({
+        name: 'upsert-service',
+        text: `
+          INSERT INTO services (
+            chitty_id, service_name, display_name, description, version,
+            base_url, category, capabilities, endpoints, health_check,
+            metadata, trust_score, trust_level, registered_by, is_canonical
+          ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
+          ON CONFLICT (service_name) DO UPDATE SET
+            display_name = EXCLUDED.display_name,
+            description = EXCLUDED.description,
+            version = EXCLUDED.version,
+            base_url = EXCLUDED.base_url,
+            category = EXCLUDED.category,
+            capabilities = EXCLUDED.capabilities,
+            endpoints = EXCLUDED.endpoints,
+            health_check = EXCLUDED.health_check,
+            metadata = EXCLUDED.metadata,
+            trust_score = EXCLUDED.trust_score,
+            trust_level = EXCLUDED.trust_level,
+            last_updated = CURRENT_TIMESTAMP
+        `,
+        values: [
+          service.chittyId,
+          service.serviceName,
+          service.displayName,
+          service.description,
+          service.version,
+          service.baseUrl,
+          service.category,
+          JSON.stringify(service.capabilities || []),
+          JSON.stringify(service.endpoints || []),
+          JSON.stringify(service.healthCheck || {}),
+          JSON.stringify(service.metadata || {}),
+          service.trustScore || 0,
+          service.trustLevel || 'UNVERIFIED',
+          service.registeredBy,
+          service.metadata?.canonical || false
+        ]
+      });
     } catch (error) {
       logger.error('Failed to upsert service in Neon', { error: error.message, service: service.serviceName });
       throw error;
@@ -193,10 +213,11 @@ export class NeonService {
 
   async getService(serviceName: string): Promise<any> {
     try {
-      const result = await this.client.query(
-        'SELECT * FROM services WHERE service_name = $1 AND is_active = true',
-        [serviceName]
-      );
+      const result = await this.pool.query({
+        name: 'get-service',
+        text: 'SELECT * FROM services WHERE service_name = $1 AND is_active = true',
+        values: [serviceName]
+      });
       return result.rows[0] || null;
     } catch (error) {
       logger.error('Failed to get service from Neon', { error: error.message, serviceName });
@@ -224,7 +245,7 @@ export class NeonService {
 
       query += ' ORDER BY service_name';
 
-      const result = await this.client.query(query, params);
+      const result = await this.pool.query(query, params);
       return result.rows;
     } catch (error) {
       logger.error('Failed to get services from Neon', { error: error.message, filters });
@@ -235,16 +256,20 @@ export class NeonService {
   // Health Monitoring
   async recordHealthStatus(serviceName: string, health: any): Promise<void> {
     try {
-      await this.client.query(`
-        INSERT INTO health_history (service_name, status, response_time, uptime, details)
-        VALUES ($1, $2, $3, $4, $5)
-      `, [
-        serviceName,
-        health.status,
-        health.responseTime || 0,
-        health.uptime || 0,
-        JSON.stringify(health.details || {})
-      ]);
+      await this.pool.query({
+        name: 'record-health-status',
+        text: `
+          INSERT INTO health_history (service_name, status, response_time, uptime, details)
+          VALUES ($1, $2, $3, $4, $5)
+        `,
+        values: [
+          serviceName,
+          health.status,
+          health.responseTime || 0,
+          health.uptime || 0,
+          JSON.stringify(health.details || {})
+        ]
+      });
     } catch (error) {
       logger.error('Failed to record health status in Neon', { error: error.message, serviceName });
     }
@@ -252,7 +277,7 @@ export class NeonService {
 
   async getHealthHistory(serviceName: string, hours: number = 24): Promise<any[]> {
     try {
-      const result = await this.client.query(`
+      const result = await this.pool.query(`
         SELECT * FROM health_history
         WHERE service_name = $1 AND checked_at > NOW() - INTERVAL '${hours} hours'
         ORDER BY checked_at DESC
@@ -268,10 +293,11 @@ export class NeonService {
   // MCP Agent State Management
   async getMCPSession(sessionId: string): Promise<any> {
     try {
-      const result = await this.client.query(
-        'SELECT * FROM mcp_sessions WHERE session_id = $1',
-        [sessionId]
-      );
+      const result = await this.pool.query({
+        name: 'get-mcp-session',
+        text: 'SELECT * FROM mcp_sessions WHERE session_id = $1',
+        values: [sessionId]
+      });
       return result.rows[0] || null;
     } catch (error) {
       logger.error('Failed to get MCP session from Neon', { error: error.message, sessionId });
@@ -281,21 +307,25 @@ export class NeonService {
 
   async upsertMCPSession(sessionId: string, userId: string, state: any, preferences: any = {}): Promise<void> {
     try {
-      await this.client.query(`
-        INSERT INTO mcp_sessions (session_id, user_id, state, preferences, queries_count)
-        VALUES ($1, $2, $3, $4, 1)
-        ON CONFLICT (session_id) DO UPDATE SET
-          state = EXCLUDED.state,
-          preferences = EXCLUDED.preferences,
-          updated_at = CURRENT_TIMESTAMP,
-          last_active = CURRENT_TIMESTAMP,
-          queries_count = mcp_sessions.queries_count + 1
-      `, [
-        sessionId,
-        userId,
-        JSON.stringify(state),
-        JSON.stringify(preferences)
-      ]);
+      await this.pool.query({
+        name: 'upsert-mcp-session',
+        text: `
+          INSERT INTO mcp_sessions (session_id, user_id, state, preferences, queries_count)
+          VALUES ($1, $2, $3, $4, 1)
+          ON CONFLICT (session_id) DO UPDATE SET
+            state = EXCLUDED.state,
+            preferences = EXCLUDED.preferences,
+            updated_at = CURRENT_TIMESTAMP,
+            last_active = CURRENT_TIMESTAMP,
+            queries_count = mcp_sessions.queries_count + 1
+        `,
+        values: [
+          sessionId,
+          userId,
+          JSON.stringify(state),
+          JSON.stringify(preferences)
+        ]
+      });
     } catch (error) {
       logger.error('Failed to upsert MCP session in Neon', { error: error.message, sessionId });
     }
@@ -304,18 +334,22 @@ export class NeonService {
   // Analytics
   async recordServiceUsage(serviceName: string, userId: string, sessionId: string, action: string, parameters: any, responseTime: number, success: boolean): Promise<void> {
     try {
-      await this.client.query(`
-        INSERT INTO service_usage (service_name, user_id, session_id, action, parameters, response_time, success)
-        VALUES ($1, $2, $3, $4, $5, $6, $7)
-      `, [
-        serviceName,
-        userId,
-        sessionId,
-        action,
-        JSON.stringify(parameters),
-        responseTime,
-        success
-      ]);
+      await this.pool.query({
+        name: 'record-service-usage',
+        text: `
+          INSERT INTO service_usage (service_name, user_id, session_id, action, parameters, response_time, success)
+          VALUES ($1, $2, $3, $4, $5, $6, $7)
+        `,
+        values: [
+          serviceName,
+          userId,
+          sessionId,
+          action,
+          JSON.stringify(parameters),
+          responseTime,
+          success
+        ]
+      });
     } catch (error) {
       logger.error('Failed to record service usage in Neon', { error: error.message });
     }
@@ -343,7 +377,7 @@ export class NeonService {
 
       query += ' GROUP BY service_name, DATE_TRUNC(\'day\', created_at) ORDER BY date DESC';
 
-      const result = await this.client.query(query, params);
+      const result = await this.pool.query(query, params);
       return result.rows;
     } catch (error) {
       logger.error('Failed to get usage analytics from Neon', { error: error.message });
@@ -354,15 +388,19 @@ export class NeonService {
   // Authority Status
   async recordAuthorityStatus(authorityName: string, status: string, responseTime: number, details: any): Promise<void> {
     try {
-      await this.client.query(`
-        INSERT INTO authority_status (authority_name, status, response_time, details)
-        VALUES ($1, $2, $3, $4)
-      `, [
-        authorityName,
-        status,
-        responseTime,
-        JSON.stringify(details)
-      ]);
+      await this.pool.query({
+        name: 'record-authority-status',
+        text: `
+          INSERT INTO authority_status (authority_name, status, response_time, details)
+          VALUES ($1, $2, $3, $4)
+        `,
+        values: [
+          authorityName,
+          status,
+          responseTime,
+          JSON.stringify(details)
+        ]
+      });
     } catch (error) {
       logger.error('Failed to record authority status in Neon', { error: error.message });
     }
@@ -370,7 +408,7 @@ export class NeonService {
 
   async getLatestAuthorityStatus(): Promise<any[]> {
     try {
-      const result = await this.client.query(`
+      const result = await this.pool.query(`
         SELECT DISTINCT ON (authority_name)
           authority_name, status, response_time, details, checked_at
         FROM authority_status
@@ -110,6 +110,26 @@ export class RedisService {
     }
   }
 
+  async mgetJSON<T = any>(keys: string[]): Promise<(T | null)[]> {
+    if (keys.length === 0) return [];
+
+    try {
+      const values = await this.client.mGet(keys);
+      return values.map((value, i) => {
+        if (!value) return null;
+        try {
+          return JSON.parse(value);
+        } catch (error) {
+          logger.error('Failed to parse JSON from Redis', { error: error.message, key: keys[i] });
+          return null;
+        }
+      });
+    } catch (error) {
+      logger.error('Redis MGET failed', { error: error.message, count: keys.length });
+      throw error;
+    }
+  }
+
   // Set operations
   async sadd(key: string, ...members: string[]): Promise<number> {
     try {
@@ -132,21 +132,16 @@ export class RegistryService {
         serviceNames = await this.redis.smembers('chittyregistry:service-names');
       }
 
-      // Fetch service details
-      const services = await Promise.all(
-        serviceNames.map(async (name) => {
-          const service = await this.redis.getJSON(`${RegistryService.SERVICES_KEY}:${name}`);
-          if (!service) return null;
-
-          // Get current health status
-          const health = await this.getHealthStatus(name);
-
-          return {
-            ...service,
-            currentHealth: health
-          };
-        })
-      );
+      // Fetch service details and health statuses in two batched round-trips
+      const [serviceData, healthData] = await Promise.all([
+        this.redis.mgetJSON(serviceNames.map(name => `${RegistryService.SERVICES_KEY}:${name}`)),
+        this.redis.mgetJSON<HealthStatus>(serviceNames.map(name => `${RegistryService.HEALTH_KEY}:${name}`))
+      ]);
+
+      const services = serviceData.map((service, i) => service && {
+        ...service,
+        currentHealth: healthData[i]
+      });
 
       let filteredServices = services.filter(Boolean) as Service[];
 
@@ -213,8 +208,9 @@ export class RegistryService {
         300 // 5 minutes TTL
       );
 
-      // Update trust score based on health metrics
-      const service = await this.getService(serviceName);
+      // Update trust score based on health metrics; only the stored record is
+      // needed here, not the health status just written above
+      const service = await this.redis.getJSON<Service>(`${RegistryService.SERVICES_KEY}:${serviceName}`);
       if (service?.chittyId) {
         await this.authority.updateServiceTrustScore(service.chittyId, {
           uptime: health.uptime || 0,
@@ -285,8 +281,8 @@ export class RegistryService {
 
     for (const [serviceName, config] of Object.entries(CHITTYOS_SERVICES)) {
       try {
-        const existingService = await this.getService(serviceName);
-        if (existingService) {
+        const exists = await this.redis.exists(`${RegistryService.SERVICES_KEY}:${serviceName}`);
+        if (exists) {
           logger.debug('Service already registered', { serviceName });
           continue;
         }
@@ -359,16 +355,18 @@ export class RegistryService {
       const serviceNames = await this.redis.smembers('chittyregistry:service-names');
       const totalServices = serviceNames.length;
 
+      // Load all service records and health statuses in two batched round-trips
+      const [services, healthChecks] = await Promise.all([
+        this.redis.mgetJSON<Service>(serviceNames.map(name => `${RegistryService.SERVICES_KEY}:${name}`)),
+        this.redis.mgetJSON<HealthStatus>(serviceNames.map(name => `${RegistryService.HEALTH_KEY}:${name}`))
+      ]);
+
       // Count healthy services
-      const healthChecks = await Promise.all(
-        serviceNames.map(name => this.getHealthStatus(name))
-      );
       const healthyServices = healthChecks.filter(h => h?.status === 'HEALTHY').length;
 
       // Count services by category
       const servicesByCategory: Record<string, number> = {};
-      for (const serviceName of serviceNames) {
-        const service = await this.getService(serviceName);
+      for (const service of services) {
         if (service) {
           servicesByCategory[service.category] = (servicesByCategory[service.category] || 0) + 1;
         }
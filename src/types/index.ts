@@ -305,7 +305,8 @@ export const RegistryConfigSchema = z.object({
   healthCheck: z.object({
     interval: z.number().default(30000), // 30 seconds
     timeout: z.number().default(5000),   // 5 seconds
-    retries: z.number().default(3)
+    retries: z.number().default(3),
+    concurrency: z.number().default(16)
   }),
   security: z.object({
     requireAuthentication: z.boolean().default(true),